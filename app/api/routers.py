@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Query
 from typing import Annotated
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
 from app.database.database import get_session
 from app.models.models import User
 from app.schemas.schemas import UserLogin, UserShow, UserRegister
@@ -15,7 +16,13 @@ async def registration(
         user_data: UserRegister,
         session: Annotated[AsyncSession, Depends(get_session)]
 ):
-    curr_user = await UserService.get_user_by_email(session=session, email=user_data.email)
+    if user_data.tenant_id not in settings.TENANTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unknown tenant"
+        )
+
+    curr_user = await UserService.get_user_by_email(session=session, email=user_data.email, tenant_id=user_data.tenant_id)
 
     if user_data.password != user_data.password_confirm:
         raise HTTPException(
@@ -35,6 +42,7 @@ async def registration(
 
         hashed_password = await get_password_hash(user_data.password)
         new_user = User(
+            tenant_id=user_data.tenant_id,
             surname=user_data.surname,
             name=user_data.name,
             middle_name=user_data.middle_name,
@@ -71,7 +79,7 @@ async def login(
             headers={"WWW-Authenticate": "Bearer"}
         )
 
-    access_token = await create_access_token(data={"sub": str(user_id)})
+    access_token = await create_access_token(data={"sub": str(user_id), "tenant": form.tenant_id})
 
     response.set_cookie(
         key="access_token",
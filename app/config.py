@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from typing import List
 from pydantic import Field
 from pydantic_settings import BaseSettings
 import secrets
@@ -16,6 +17,31 @@ class Settings(BaseSettings):
 
     ACCESS_TOKEN_EXPIRE_HOURS: int = 24
 
+    DEFAULT_TENANT: str = "default"
+    TENANTS: List[str] = ["default"]
+    USERS_PARTITIONS: int = 8
+
+    AUTH_CONCURRENCY_LIMIT: int = 4
+    AUTH_MAX_QUEUE: int = 20
+    AUTH_QUEUE_TIMEOUT: float = 1.0
+    READ_CONCURRENCY_LIMIT: int = 10
+    READ_MAX_QUEUE: int = 100
+    READ_QUEUE_TIMEOUT: float = 0.5
+    WRITE_CONCURRENCY_LIMIT: int = 5
+    WRITE_MAX_QUEUE: int = 50
+    WRITE_QUEUE_TIMEOUT: float = 1.0
+    ADMIN_BULK_CONCURRENCY_LIMIT: int = 2
+    ADMIN_BULK_MAX_QUEUE: int = 5
+    ADMIN_BULK_QUEUE_TIMEOUT: float = 2.0
+
+    JOB_WORKERS: int = 2
+    JOB_CHUNK_SIZE: int = 500
+    JOB_POLL_INTERVAL: float = 1.0
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_RETRY_BACKOFF_SECONDS: int = 30
+    JOB_STALE_AFTER_SECONDS: int = 300
+    JOB_EXPORT_DIR: str = "exports"
+
     model_config = {
         'env_file': Path(__file__).parent.parent / '.env',
         'env_file_encoding': 'utf-8'
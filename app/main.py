@@ -1,12 +1,16 @@
 from contextlib import asynccontextmanager
 from typing import Annotated, List
-from fastapi import FastAPI, Depends, Query, HTTPException, status, Response
+from fastapi import FastAPI, Depends, Query, HTTPException, status, Response, Body
+from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.routers import router
 from app.database.database import get_session, engine, Base
-from app.models.models import User, UserRole
-from app.schemas.schemas import UserShow, UserOwnUpdate, UserManagerShow, UserUpdate
+from app.middleware.overload import OverloadMiddleware, get_overload_stats
+from app.models.models import User, UserRole, JobKind, JobStatus
+from app.schemas.schemas import UserShow, UserOwnUpdate, UserManagerShow, UserUpdate, JobCreate, JobShow
+from app.services.JobService import JobService
 from app.services.UserService import UserService
+from app.services.job_worker import start_job_workers, stop_job_workers, ExportUsersHandler
 from app.services.dependencies import get_current_user, get_current_manager, get_current_admin
 from app.services.helpers import verify_password, logout_with_cookie
 from app.test_data import create_test_users
@@ -24,10 +28,15 @@ async def lifespan(app: FastAPI):
         await create_test_users()
     except Exception as e:
         print(f"Error while creating test data: {e}")
+
+    job_workers = await start_job_workers()
     yield
+    await stop_job_workers(job_workers)
 
 app = FastAPI(lifespan=lifespan)
 
+app.add_middleware(OverloadMiddleware)
+
 app.include_router(router)
 
 @app.get("/user/profile", response_model=UserShow, tags=["General"])
@@ -59,7 +68,7 @@ async def update_me(update_data : UserOwnUpdate,
     if has_email is not None and current_user.email != has_email:
         if password is not None:
             if await verify_password(password, current_user.hashed_password):
-                us_email = await UserService.get_user_by_email(session, current_user.email)
+                us_email = await UserService.get_user_by_email(session, current_user.email, current_user.tenant_id)
 
                 if us_email is not None:
                     response["details"].append("This email address is already in use")
@@ -72,7 +81,7 @@ async def update_me(update_data : UserOwnUpdate,
             update_fields.pop("email")
 
     if update_fields:
-        await UserService.update_user_data(session, current_user.id, update_fields)
+        await UserService.update_user_data(session, current_user.id, current_user.tenant_id, update_fields)
         response["details"].append("successfully updated")
 
     response["User"] = UserShow(**current_user.__dict__)
@@ -86,7 +95,7 @@ async def delete_me(current_user : Annotated[User, Depends(get_current_user)], s
 
 @app.get("/users/get", response_model=List[UserManagerShow], tags = ["Managers only"])
 async def get_users(current_user : Annotated[User, Depends(get_current_manager)], session : Annotated[AsyncSession, Depends(get_session)]):
-    result = await UserService.get_all_users(session = session)
+    result = await UserService.get_all_users(session = session, tenant_id = current_user.tenant_id)
     return result
 
 @app.put("/user/update/{user_id}", tags = ["Managers only"])
@@ -97,7 +106,7 @@ async def update_user_info(current_user : Annotated[User,
 ):
     update_fields = update_user_data.model_dump(exclude_defaults=True)
 
-    updated_user = await UserService.get_user_by_id(session, user_id=user_id)
+    updated_user = await UserService.get_user_by_id(session, user_id=user_id, tenant_id=current_user.tenant_id)
     if not updated_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -113,13 +122,13 @@ async def update_user_info(current_user : Annotated[User,
     if not update_fields:
         return {"message" : "There is nothing to change"}
 
-    response = await UserService.update_user_data(session, updated_user.id, update_fields)
+    response = await UserService.update_user_data(session, updated_user.id, updated_user.tenant_id, update_fields)
     return response
 
 @app.get("/user/get/{user_id}", response_model=UserManagerShow, tags = ["Managers only"])
 async def get_user(current_user : Annotated[User, Depends(get_current_manager)], session : Annotated[AsyncSession, Depends(get_session)],
                    user_id : int):
-    result = await UserService.get_user_by_id(session, user_id=user_id)
+    result = await UserService.get_user_by_id(session, user_id=user_id, tenant_id=current_user.tenant_id)
     if not result:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -129,7 +138,7 @@ async def get_user(current_user : Annotated[User, Depends(get_current_manager)],
 
 @app.put("/user/put/{user_id}", tags = ["Admins only"])
 async def set_role_to_user(current_user : Annotated[User, Depends(get_current_admin)], session : Annotated[AsyncSession, Depends(get_session)], user_id : int, role : UserRole):
-    updated_user = await UserService.get_user_by_id(session, user_id=user_id)
+    updated_user = await UserService.get_user_by_id(session, user_id=user_id, tenant_id=current_user.tenant_id)
     if not updated_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -148,13 +157,13 @@ async def set_role_to_user(current_user : Annotated[User, Depends(get_current_ad
             detail="You can not demote other admins"
         )
 
-    response = await UserService.update_user_data(session, user_id=user_id, update_fields={"role" : role})
+    response = await UserService.update_user_data(session, user_id=user_id, tenant_id=current_user.tenant_id, update_fields={"role" : role})
     return response
 
 @app.delete("/user/delete/{user_id}", tags = ["Admins only"])
 async def delete_user(current_user : Annotated[User, Depends(get_current_admin)], session : Annotated[AsyncSession, Depends(get_session)],
                       user_id : int):
-    deleted_user = await UserService.get_user_by_id(session, user_id=user_id)
+    deleted_user = await UserService.get_user_by_id(session, user_id=user_id, tenant_id=current_user.tenant_id)
     if not deleted_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -170,6 +179,72 @@ async def delete_user(current_user : Annotated[User, Depends(get_current_admin)]
     response = await UserService.soft_remove(session, user=deleted_user)
     return response
 
+@app.post("/jobs", response_model=JobShow, tags = ["Admins only"])
+async def submit_job(current_user : Annotated[User, Depends(get_current_admin)], session : Annotated[AsyncSession, Depends(get_session)],
+                     job_data : Annotated[JobCreate, Body(discriminator="kind")]):
+    if job_data.kind == JobKind.SET_ROLE and UserRole.ADMIN in (job_data.params.role, job_data.params.from_role):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only change roles between user and manager"
+        )
+
+    job = await JobService.submit(session, tenant_id=current_user.tenant_id, created_by=current_user.id,
+                                  kind=job_data.kind, params=job_data.params.model_dump(mode="json"))
+    return job
+
+@app.get("/jobs/{job_id}", response_model=JobShow, tags = ["Admins only"])
+async def get_job(current_user : Annotated[User, Depends(get_current_admin)], session : Annotated[AsyncSession, Depends(get_session)],
+                  job_id : int):
+    job = await JobService.get_job(session, job_id=job_id, tenant_id=current_user.tenant_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job with id {job_id} was not found"
+        )
+    return job
+
+@app.post("/jobs/{job_id}/cancel", response_model=JobShow, tags = ["Admins only"])
+async def cancel_job(current_user : Annotated[User, Depends(get_current_admin)], session : Annotated[AsyncSession, Depends(get_session)],
+                     job_id : int):
+    job = await JobService.get_job(session, job_id=job_id, tenant_id=current_user.tenant_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job with id {job_id} was not found"
+        )
+
+    job = await JobService.request_cancel(session, job)
+    return job
+
+@app.get("/jobs/{job_id}/download", tags = ["Admins only"])
+async def download_job_file(current_user : Annotated[User, Depends(get_current_admin)], session : Annotated[AsyncSession, Depends(get_session)],
+                            job_id : int):
+    job = await JobService.get_job(session, job_id=job_id, tenant_id=current_user.tenant_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job with id {job_id} was not found"
+        )
+
+    if job.kind != JobKind.EXPORT_USERS or job.status != JobStatus.COMPLETED:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only completed export jobs have a file to download"
+        )
+
+    path = ExportUsersHandler.path(job)
+    if not path.is_file():
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Export file is no longer available, submit the export again"
+        )
+
+    return FileResponse(path, media_type="text/csv", filename=f"users_{job.id}.csv")
+
+@app.get("/overload/stats", tags = ["Admins only"])
+async def overload_stats(current_user : Annotated[User, Depends(get_current_admin)]):
+    return get_overload_stats()
+
 @app.get("/admin-check", tags=["Check Roles"])
 async def check_admin(current_user : Annotated[User, Depends(get_current_admin)]):
     return {"MSG" : f"Hello, {current_user.name}! Your current role is {current_user.role}"}
@@ -178,9 +253,9 @@ async def check_admin(current_user : Annotated[User, Depends(get_current_admin)]
 async def check_manager(current_user : Annotated[User, Depends(get_current_manager)]):
     return {"MSG" : f"Hello, {current_user.name}! Your current role is {current_user.role}"}
 
-@app.get("/all-user")
-async def all_user(session : Annotated[AsyncSession, Depends(get_session)]):
-    result = await UserService.get_all_users(session)
+@app.get("/all-user", response_model=List[UserManagerShow], tags = ["Admins only"])
+async def all_user(current_user : Annotated[User, Depends(get_current_admin)], session : Annotated[AsyncSession, Depends(get_session)]):
+    result = await UserService.get_all_users(session, current_user.tenant_id)
     return result
 
 if __name__ == "__main__":
@@ -0,0 +1,115 @@
+import asyncio
+from starlette.responses import JSONResponse
+from starlette.routing import Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.config import settings
+
+AUTH = "auth"
+READ = "read"
+WRITE = "write"
+ADMIN_BULK = "admin_bulk"
+
+# Keyed by route template; routes not listed here fall back to a class chosen by the HTTP method.
+ROUTE_CLASSES = {
+    "/login": AUTH,
+    "/registration": AUTH,
+    "/user/profile/update": AUTH,
+    "/users/get": ADMIN_BULK,
+    "/all-user": ADMIN_BULK,
+    "/jobs/{job_id}/download": ADMIN_BULK,
+}
+
+class RouteClassLimiter:
+    def __init__(self, name: str, concurrency: int, max_queue: int, queue_timeout: float):
+        self.name = name
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self.queued = 0
+        self.shed = 0
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def acquire(self) -> bool:
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+            self.active += 1
+            return True
+
+        if self.queued >= self.max_queue:
+            self.shed += 1
+            return False
+
+        self.queued += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.shed += 1
+            return False
+        finally:
+            self.queued -= 1
+
+        self.active += 1
+        return True
+
+    def release(self) -> None:
+        self.active -= 1
+        self._semaphore.release()
+
+    def stats(self) -> dict:
+        return {
+            "concurrency": self.concurrency,
+            "active": self.active,
+            "queued": self.queued,
+            "max_queue": self.max_queue,
+            "shed": self.shed
+        }
+
+limiters = {
+    AUTH: RouteClassLimiter(AUTH, settings.AUTH_CONCURRENCY_LIMIT,
+                            settings.AUTH_MAX_QUEUE, settings.AUTH_QUEUE_TIMEOUT),
+    READ: RouteClassLimiter(READ, settings.READ_CONCURRENCY_LIMIT,
+                            settings.READ_MAX_QUEUE, settings.READ_QUEUE_TIMEOUT),
+    WRITE: RouteClassLimiter(WRITE, settings.WRITE_CONCURRENCY_LIMIT,
+                             settings.WRITE_MAX_QUEUE, settings.WRITE_QUEUE_TIMEOUT),
+    ADMIN_BULK: RouteClassLimiter(ADMIN_BULK, settings.ADMIN_BULK_CONCURRENCY_LIMIT,
+                                  settings.ADMIN_BULK_MAX_QUEUE, settings.ADMIN_BULK_QUEUE_TIMEOUT),
+}
+
+def get_route_class(scope: Scope) -> str:
+    for route in scope["app"].router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            route_class = ROUTE_CLASSES.get(route.path)
+            if route_class is not None:
+                return route_class
+            break
+    return READ if scope["method"] in ("GET", "HEAD", "OPTIONS") else WRITE
+
+def get_overload_stats() -> dict:
+    return {name: limiter.stats() for name, limiter in limiters.items()}
+
+class OverloadMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        limiter = limiters[get_route_class(scope)]
+
+        if not await limiter.acquire():
+            response = JSONResponse(
+                status_code=503,
+                content={"detail": "Server is overloaded, try again later"},
+                headers={"Retry-After": "1"}
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
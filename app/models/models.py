@@ -1,8 +1,9 @@
 from enum import Enum
-from sqlalchemy import Integer, String, Boolean, text, DateTime
+from sqlalchemy import Integer, String, Boolean, text, DateTime, UniqueConstraint, DDL, event, JSON, Text
 from sqlalchemy.orm import Mapped, mapped_column
 from typing import Optional
 from datetime import datetime
+from app.config import settings
 from app.database.database import Base
 
 class UserRole(str, Enum):
@@ -10,18 +11,70 @@ class UserRole(str, Enum):
     MANAGER = "manager"
     USER = "user"
 
+class JobKind(str, Enum):
+    SET_ROLE = "set_role"
+    EXPORT_USERS = "export_users"
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "email", name="uq_users_tenant_email"),
+        {"postgresql_partition_by": "HASH (tenant_id)"},
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    tenant_id: Mapped[str] = mapped_column(String(50), primary_key=True, default=settings.DEFAULT_TENANT)
     surname: Mapped[str] = mapped_column(String(100), nullable=False)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     middle_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
-    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
     hashed_password: Mapped[str] = mapped_column("password_hash", String(255), nullable=False)
     role: Mapped[str] = mapped_column(String(20), default=UserRole.USER, server_default=UserRole.USER, nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, server_default=text("true"))
     is_superuser: Mapped[bool] = mapped_column(Boolean, default=False, server_default=text("false"))
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, server_default=text("now()"))
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, server_default=text("now()"))
-    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
\ No newline at end of file
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+class Job(Base):
+    __tablename__ = "jobs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    tenant_id: Mapped[str] = mapped_column(String(50), nullable=False)
+    kind: Mapped[str] = mapped_column(String(50), nullable=False)
+    params: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
+    status: Mapped[str] = mapped_column(String(20), default=JobStatus.PENDING, server_default=JobStatus.PENDING, nullable=False, index=True)
+    checkpoint: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    processed: Mapped[int] = mapped_column(Integer, default=0, server_default=text("0"), nullable=False)
+    total: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, server_default=text("0"), nullable=False)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+    cancel_requested: Mapped[bool] = mapped_column(Boolean, default=False, server_default=text("false"))
+    result: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_by: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, server_default=text("now()"))
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    next_run_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+# PostgreSQL requires every partition of a partitioned table to exist before rows can be inserted,
+# so on fresh installs the hash partitions are created right after the parent "users" table.
+# Existing unpartitioned tables are converted by the 0001_partition_users_by_tenant migration.
+for remainder in range(settings.USERS_PARTITIONS):
+    event.listen(
+        User.__table__,
+        "after_create",
+        DDL(
+            f"CREATE TABLE IF NOT EXISTS users_p{remainder} PARTITION OF users "
+            f"FOR VALUES WITH (MODULUS {settings.USERS_PARTITIONS}, REMAINDER {remainder})"
+        ).execute_if(dialect="postgresql")
+    )
\ No newline at end of file
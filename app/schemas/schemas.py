@@ -1,10 +1,13 @@
 from pydantic import BaseModel, Field, EmailStr, ConfigDict
-from typing import Optional
-from app.models.models import UserRole
+from typing import Optional, Union, Literal
+from datetime import datetime
+from app.config import settings
+from app.models.models import UserRole, JobKind, JobStatus
 
 class UserLogin(BaseModel):
     email: EmailStr
     password: str
+    tenant_id: str = Field(settings.DEFAULT_TENANT, min_length=1, max_length=50)
 
 class UserRegister(BaseModel):
     surname: str = Field(..., min_length=1, max_length=50)
@@ -13,6 +16,7 @@ class UserRegister(BaseModel):
     email: EmailStr
     password: str = Field(..., min_length=3, json_schema_extra={"format": "password"})
     password_confirm: str = Field(..., json_schema_extra={"format": "password"})
+    tenant_id: str = Field(settings.DEFAULT_TENANT, min_length=1, max_length=50)
 
 class UserUpdate(BaseModel):
     surname: Optional[str] = Field(None, min_length=1, max_length=50)
@@ -33,4 +37,40 @@ class UserShow(BaseModel):
 
 class UserManagerShow(UserShow):
     id: int
-    is_active: bool
\ No newline at end of file
+    tenant_id: str
+    is_active: bool
+
+class SetRoleParams(BaseModel):
+    role: UserRole
+    from_role: Optional[UserRole] = None
+
+class ExportUsersParams(BaseModel):
+    pass
+
+class SetRoleJobCreate(BaseModel):
+    kind: Literal[JobKind.SET_ROLE]
+    params: SetRoleParams
+
+class ExportUsersJobCreate(BaseModel):
+    kind: Literal[JobKind.EXPORT_USERS]
+    params: ExportUsersParams = Field(default_factory=ExportUsersParams)
+
+JobCreate = Union[SetRoleJobCreate, ExportUsersJobCreate]
+
+class JobShow(BaseModel):
+    id: int
+    kind: JobKind
+    params: dict
+    status: JobStatus
+    processed: int
+    total: Optional[int] = None
+    attempts: int
+    max_attempts: int
+    cancel_requested: bool
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, or_, and_
+from fastapi import HTTPException, status
+from app.config import settings
+from app.models.models import Job, JobStatus
+
+class JobService:
+    @classmethod
+    async def submit(cls, session: AsyncSession, tenant_id: str, created_by: int, kind: str, params: dict):
+        job = Job(
+            tenant_id=tenant_id,
+            kind=kind,
+            params=params,
+            max_attempts=settings.JOB_MAX_ATTEMPTS,
+            created_by=created_by
+        )
+        try:
+            session.add(job)
+            await session.commit()
+            await session.refresh(job)
+        except Exception as e:
+            await session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        return job
+
+    @classmethod
+    async def get_job(cls, session: AsyncSession, job_id: int, tenant_id: str):
+        stmt = select(Job).where(Job.tenant_id == tenant_id, Job.id == job_id)
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    @classmethod
+    async def request_cancel(cls, session: AsyncSession, job: Job):
+        try:
+            await session.refresh(job, with_for_update=True)
+            if job.status == JobStatus.PENDING:
+                job.status = JobStatus.CANCELLED
+                job.finished_at = datetime.utcnow()
+            elif job.status == JobStatus.RUNNING:
+                job.cancel_requested = True
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=str(e)
+            )
+        return job
+
+    @classmethod
+    async def claim_next(cls, session: AsyncSession) -> Optional[Job]:
+        now = datetime.utcnow()
+        stale_before = now - timedelta(seconds=settings.JOB_STALE_AFTER_SECONDS)
+        is_stale = and_(Job.status == JobStatus.RUNNING, Job.heartbeat_at < stale_before)
+
+        exhausted_stmt = (update(Job)
+                          .where(is_stale, Job.attempts >= Job.max_attempts)
+                          .values(status=JobStatus.FAILED, finished_at=now,
+                                  error="Job was interrupted too many times"))
+        stmt = (select(Job)
+                .where(
+                    or_(
+                        and_(Job.status == JobStatus.PENDING,
+                             or_(Job.next_run_at.is_(None), Job.next_run_at <= now)),
+                        is_stale
+                    ),
+                    Job.attempts < Job.max_attempts
+                )
+                .order_by(Job.id)
+                .limit(1)
+                .with_for_update(skip_locked=True))
+        try:
+            await session.execute(exhausted_stmt)
+            job = (await session.execute(stmt)).scalar_one_or_none()
+            if job is None:
+                await session.commit()
+                return None
+
+            job.status = JobStatus.RUNNING
+            job.attempts += 1
+            job.started_at = job.started_at or now
+            job.heartbeat_at = now
+            await session.commit()
+            return job
+        except Exception as e:
+            await session.rollback()
+            raise e
@@ -5,13 +5,15 @@ from app.models.models import User
 
 class UserService:
     @classmethod
-    async def update_user_data(cls, session: AsyncSession, user_id: int, update_fields: dict):
+    async def update_user_data(cls, session: AsyncSession, user_id: int, tenant_id: str, update_fields: dict):
         try:
-            stmt = update(User).where(User.id == user_id).values(**update_fields)
+            stmt = (update(User)
+                    .where(User.tenant_id == tenant_id, User.id == user_id)
+                    .values(**update_fields))
             await session.execute(stmt)
             await session.commit()
 
-            updated_user = await cls.get_user_by_id(session, user_id)
+            updated_user = await cls.get_user_by_id(session, user_id, tenant_id)
             return {"message": "successfully updated", "user": updated_user}
         except Exception as e:
             await session.rollback()
@@ -21,19 +23,21 @@ class UserService:
             )
 
     @classmethod
-    async def get_user_by_email(cls, session: AsyncSession, email: str):
-        stmt = select(User).where(User.email == email)
+    async def get_user_by_email(cls, session: AsyncSession, email: str, tenant_id: str):
+        stmt = select(User).where(User.tenant_id == tenant_id, User.email == email)
         result = await session.execute(stmt)
         return result.scalar_one_or_none()
 
     @classmethod
-    async def get_user_by_id(cls, session: AsyncSession, user_id: int):
-        return await session.get(User, user_id)
+    async def get_user_by_id(cls, session: AsyncSession, user_id: int, tenant_id: str):
+        return await session.get(User, {"id": user_id, "tenant_id": tenant_id})
 
     @classmethod
     async def soft_remove(cls, session: AsyncSession, user: User):
         try:
-            stmt = update(User).where(User.id == user.id).values(is_active=False)
+            stmt = (update(User)
+                    .where(User.tenant_id == user.tenant_id, User.id == user.id)
+                    .values(is_active=False))
             await session.execute(stmt)
             await session.commit()
         except Exception as e:
@@ -64,7 +68,7 @@ class UserService:
             raise e
 
     @classmethod
-    async def get_all_users(cls, session: AsyncSession):
-        stmt = select(User)
+    async def get_all_users(cls, session: AsyncSession, tenant_id: str):
+        stmt = select(User).where(User.tenant_id == tenant_id)
         result = await session.execute(stmt)
         return result.scalars().all()
\ No newline at end of file
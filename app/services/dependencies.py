@@ -23,12 +23,13 @@ async def get_current_user(
     try:
         payload = jwt.decode(access_token, settings.SECRET, algorithms=[settings.ALGORITHM])
         user_id: str = payload.get("sub")
-        if user_id is None:
+        tenant_id: str = payload.get("tenant")
+        if user_id is None or tenant_id is None:
             raise credentials_exception
     except InvalidTokenError:
         raise credentials_exception
 
-    user = await session.get(User, int(user_id))
+    user = await session.get(User, {"id": int(user_id), "tenant_id": tenant_id})
     if user is None or not user.is_active:
         raise credentials_exception
 
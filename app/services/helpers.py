@@ -1,3 +1,4 @@
+import asyncio
 import jwt
 from pwdlib import PasswordHash
 from fastapi import HTTPException, status, Response
@@ -11,16 +12,16 @@ from app.models.models import User
 password_hash = PasswordHash.recommended()
 
 async def get_password_hash(password: str) -> str:
-    return password_hash.hash(password)
+    return await asyncio.to_thread(password_hash.hash, password)
 
 async def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return password_hash.verify(plain_password, hashed_password)
+    return await asyncio.to_thread(password_hash.verify, plain_password, hashed_password)
 
-async def authenticate_user(session: AsyncSession, email: str, password: str) -> Optional[int]:
+async def authenticate_user(session: AsyncSession, email: str, password: str, tenant_id: str) -> Optional[int]:
     try:
         user_res = await session.execute(
             select(User.id, User.hashed_password, User.is_active)
-            .where(User.email == email)
+            .where(User.tenant_id == tenant_id, User.email == email)
         )
         user_row = user_res.first()
 
@@ -0,0 +1,194 @@
+import asyncio
+import csv
+import io
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func
+from app.config import settings
+from app.database.database import session_factory
+from app.models.models import Job, JobKind, JobStatus, User, UserRole
+from app.services.JobService import JobService
+
+class SetRoleHandler:
+    @classmethod
+    def filters(cls, job: Job) -> list:
+        clauses = [User.tenant_id == job.tenant_id, User.role != UserRole.ADMIN]
+        from_role = job.params.get("from_role")
+        if from_role is not None:
+            clauses.append(User.role == from_role)
+        return clauses
+
+    @classmethod
+    async def process(cls, session: AsyncSession, job: Job, users: List[User]) -> None:
+        stmt = (update(User)
+                .where(User.tenant_id == job.tenant_id, User.id.in_([user.id for user in users]))
+                .values(role=job.params["role"]))
+        await session.execute(stmt)
+
+    @classmethod
+    def result(cls, job: Job) -> Optional[dict]:
+        return {"updated": job.processed}
+
+class ExportUsersHandler:
+    fields = ("id", "surname", "name", "middle_name", "email", "role", "is_active", "created_at")
+
+    @classmethod
+    def path(cls, job: Job) -> Path:
+        return Path(settings.JOB_EXPORT_DIR) / f"users_{job.id}.csv"
+
+    @classmethod
+    def filters(cls, job: Job) -> list:
+        return [User.tenant_id == job.tenant_id]
+
+    @classmethod
+    async def process(cls, session: AsyncSession, job: Job, users: List[User]) -> None:
+        rows = [[getattr(user, field) for field in cls.fields] for user in users]
+        # The file is cut back to the size committed with the last checkpoint, so a retried chunk overwrites
+        # whatever a failed attempt appended instead of duplicating it.
+        offset = (job.result or {}).get("bytes", 0)
+        size = await asyncio.to_thread(cls._write, cls.path(job), rows, offset, job.checkpoint is None)
+        job.result = {"bytes": size}
+
+    @classmethod
+    def _write(cls, path: Path, rows: list, offset: int, first_chunk: bool) -> int:
+        buffer = io.StringIO(newline="")
+        writer = csv.writer(buffer)
+        if first_chunk:
+            writer.writerow(cls.fields)
+        writer.writerows(rows)
+        data = buffer.getvalue().encode("utf-8")
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "r+b" if path.exists() else "w+b") as file:
+            file.truncate(offset)
+            file.seek(offset)
+            file.write(data)
+        return offset + len(data)
+
+    @classmethod
+    def result(cls, job: Job) -> Optional[dict]:
+        return {"bytes": (job.result or {}).get("bytes", 0), "rows": job.processed}
+
+JOB_HANDLERS = {
+    JobKind.SET_ROLE: SetRoleHandler,
+    JobKind.EXPORT_USERS: ExportUsersHandler,
+}
+
+def owns_job(job: Job, attempt: int) -> bool:
+    # A job marked failed or reclaimed by another worker as stale no longer belongs to this attempt.
+    return job.status == JobStatus.RUNNING and job.attempts == attempt
+
+async def run_job_chunk(job_id: int, attempt: int) -> bool:
+    async with session_factory() as session:
+        try:
+            job = await session.get(Job, job_id, with_for_update=True)
+            now = datetime.utcnow()
+
+            if not owns_job(job, attempt):
+                await session.rollback()
+                return False
+
+            if job.cancel_requested:
+                job.status = JobStatus.CANCELLED
+                job.finished_at = now
+                await session.commit()
+                return False
+
+            handler = JOB_HANDLERS[JobKind(job.kind)]
+
+            if job.total is None:
+                job.total = await session.scalar(
+                    select(func.count()).select_from(User).where(*handler.filters(job))
+                )
+
+            stmt = select(User).where(*handler.filters(job))
+            if job.checkpoint is not None:
+                stmt = stmt.where(User.id > job.checkpoint)
+            users = (await session.execute(stmt.order_by(User.id).limit(settings.JOB_CHUNK_SIZE))).scalars().all()
+
+            if not users:
+                job.status = JobStatus.COMPLETED
+                job.result = handler.result(job)
+                job.error = None
+                job.finished_at = now
+                await session.commit()
+                return False
+
+            await handler.process(session, job, users)
+
+            job.checkpoint = users[-1].id
+            job.processed += len(users)
+            job.heartbeat_at = datetime.utcnow()
+            await session.commit()
+            return True
+        except Exception as e:
+            await session.rollback()
+            raise e
+
+async def fail_job(job_id: int, attempt: int, error: Exception) -> None:
+    async with session_factory() as session:
+        job = await session.get(Job, job_id, with_for_update=True)
+        if not owns_job(job, attempt):
+            await session.rollback()
+            return
+
+        job.error = str(error)
+        if job.attempts >= job.max_attempts:
+            job.status = JobStatus.FAILED
+            job.finished_at = datetime.utcnow()
+        else:
+            job.status = JobStatus.PENDING
+            backoff = settings.JOB_RETRY_BACKOFF_SECONDS * 2 ** (job.attempts - 1)
+            job.next_run_at = datetime.utcnow() + timedelta(seconds=backoff)
+        await session.commit()
+
+async def release_job(job_id: int, attempt: int) -> None:
+    async with session_factory() as session:
+        job = await session.get(Job, job_id, with_for_update=True)
+        if owns_job(job, attempt):
+            job.status = JobStatus.PENDING
+            job.attempts -= 1
+            job.next_run_at = None
+        await session.commit()
+
+async def job_worker(worker_id: int) -> None:
+    while True:
+        try:
+            async with session_factory() as session:
+                job = await JobService.claim_next(session)
+        except Exception as e:
+            print(f"Job worker {worker_id}: error while claiming a job: {e}")
+            await asyncio.sleep(settings.JOB_POLL_INTERVAL)
+            continue
+
+        if job is None:
+            await asyncio.sleep(settings.JOB_POLL_INTERVAL)
+            continue
+
+        job_id, attempt = job.id, job.attempts
+        try:
+            while await run_job_chunk(job_id, attempt):
+                pass
+        except asyncio.CancelledError:
+            # Shutdown is not the job's fault, so give the attempt back and let the next worker resume it.
+            try:
+                await release_job(job_id, attempt)
+            except Exception as e:
+                print(f"Job worker {worker_id}: error while releasing job {job_id}: {e}")
+            raise
+        except Exception as e:
+            print(f"Job worker {worker_id}: job {job_id} failed: {e}")
+            try:
+                await fail_job(job_id, attempt, e)
+            except Exception as fail_error:
+                print(f"Job worker {worker_id}: error while failing job {job_id}: {fail_error}")
+
+async def start_job_workers() -> List[asyncio.Task]:
+    return [asyncio.create_task(job_worker(worker_id)) for worker_id in range(settings.JOB_WORKERS)]
+
+async def stop_job_workers(workers: List[asyncio.Task]) -> None:
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
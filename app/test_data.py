@@ -1,5 +1,6 @@
 import asyncio
 from sqlalchemy import select
+from app.config import settings
 from app.database.database import session_factory
 from app.models.models import User, UserRole
 from app.services.helpers import get_password_hash
@@ -7,11 +8,14 @@ from app.services.helpers import get_password_hash
 async def create_test_users():
     async with session_factory() as session:
         try:
-            existing_users = await session.execute(select(User).where(User.email.in_([
-                "admin@example.com",
-                "manager@example.com",
-                "user@example.com"
-            ])))
+            existing_users = await session.execute(select(User).where(
+                User.tenant_id == settings.DEFAULT_TENANT,
+                User.email.in_([
+                    "admin@example.com",
+                    "manager@example.com",
+                    "user@example.com"
+                ])
+            ))
 
             existing_emails = [user.email for user in existing_users.scalars()]
 
@@ -45,6 +49,7 @@ async def create_test_users():
                     hashed_password = await get_password_hash(user_data["password"])
 
                     user = User(
+                        tenant_id=settings.DEFAULT_TENANT,
                         surname=user_data["surname"],
                         name=user_data["name"],
                         email=user_data["email"],
@@ -9,9 +9,12 @@ import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from app.config import settings
 from app.database.database import Base
+import app.models.models
 
 config = context.config
+config.set_main_option("sqlalchemy.url", settings.get_db_url())
 
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
@@ -0,0 +1,116 @@
+"""partition users by tenant
+
+Revision ID: 0001_partition_users_by_tenant
+Revises: 
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.config import settings
+
+revision: str = '0001_partition_users_by_tenant'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+USER_COLUMNS = ("id, surname, name, middle_name, email, password_hash, role, "
+                "is_active, is_superuser, created_at, updated_at, deleted_at")
+
+
+def _users_state(conn) -> str:
+    if not sa.inspect(conn).has_table("users"):
+        return "missing"
+    partitioned = conn.execute(sa.text(
+        "SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'users'::regclass"
+    )).first()
+    return "partitioned" if partitioned else "plain"
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    state = _users_state(conn)
+
+    # Fresh installs that were bootstrapped by create_all already have the partitioned table.
+    if state == "partitioned":
+        return
+
+    if state == "plain":
+        op.execute("ALTER TABLE users RENAME TO users_legacy")
+        op.execute("ALTER INDEX users_pkey RENAME TO users_legacy_pkey")
+        op.execute("ALTER SEQUENCE users_id_seq OWNED BY NONE")
+    else:
+        op.execute("CREATE SEQUENCE users_id_seq")
+
+    op.execute("""
+        CREATE TABLE users (
+            id INTEGER NOT NULL DEFAULT nextval('users_id_seq'),
+            tenant_id VARCHAR(50) NOT NULL,
+            surname VARCHAR(100) NOT NULL,
+            name VARCHAR(100) NOT NULL,
+            middle_name VARCHAR(100),
+            email VARCHAR(255) NOT NULL,
+            password_hash VARCHAR(255) NOT NULL,
+            role VARCHAR(20) NOT NULL DEFAULT 'user',
+            is_active BOOLEAN NOT NULL DEFAULT true,
+            is_superuser BOOLEAN NOT NULL DEFAULT false,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+            deleted_at TIMESTAMP WITHOUT TIME ZONE,
+            CONSTRAINT users_pkey PRIMARY KEY (id, tenant_id),
+            CONSTRAINT uq_users_tenant_email UNIQUE (tenant_id, email)
+        ) PARTITION BY HASH (tenant_id)
+    """)
+    op.execute("ALTER SEQUENCE users_id_seq OWNED BY users.id")
+
+    for remainder in range(settings.USERS_PARTITIONS):
+        op.execute(
+            f"CREATE TABLE users_p{remainder} PARTITION OF users "
+            f"FOR VALUES WITH (MODULUS {settings.USERS_PARTITIONS}, REMAINDER {remainder})"
+        )
+
+    if state == "plain":
+        conn.execute(
+            sa.text(f"INSERT INTO users (tenant_id, {USER_COLUMNS}) "
+                    f"SELECT :tenant_id, {USER_COLUMNS} FROM users_legacy"),
+            {"tenant_id": settings.DEFAULT_TENANT}
+        )
+        op.execute("SELECT setval('users_id_seq', GREATEST((SELECT max(id) FROM users), 1))")
+        op.execute("DROP TABLE users_legacy")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE users RENAME TO users_partitioned")
+    op.execute("ALTER INDEX users_pkey RENAME TO users_partitioned_pkey")
+    op.execute("ALTER SEQUENCE users_id_seq OWNED BY NONE")
+
+    op.execute("""
+        CREATE TABLE users (
+            id INTEGER NOT NULL DEFAULT nextval('users_id_seq'),
+            surname VARCHAR(100) NOT NULL,
+            name VARCHAR(100) NOT NULL,
+            middle_name VARCHAR(100),
+            email VARCHAR(255) NOT NULL,
+            password_hash VARCHAR(255) NOT NULL,
+            role VARCHAR(20) NOT NULL DEFAULT 'user',
+            is_active BOOLEAN NOT NULL DEFAULT true,
+            is_superuser BOOLEAN NOT NULL DEFAULT false,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+            deleted_at TIMESTAMP WITHOUT TIME ZONE,
+            CONSTRAINT users_pkey PRIMARY KEY (id),
+            CONSTRAINT users_email_key UNIQUE (email)
+        )
+    """)
+    op.execute("ALTER SEQUENCE users_id_seq OWNED BY users.id")
+
+    # Emails are only unique per tenant, so only the default tenant fits back into the global constraint.
+    op.get_bind().execute(
+        sa.text(f"INSERT INTO users ({USER_COLUMNS}) "
+                f"SELECT {USER_COLUMNS} FROM users_partitioned WHERE tenant_id = :tenant_id"),
+        {"tenant_id": settings.DEFAULT_TENANT}
+    )
+    op.execute("DROP TABLE users_partitioned")
@@ -0,0 +1,58 @@
+"""create jobs
+
+Revision ID: 0002_create_jobs
+Revises: 0001_partition_users_by_tenant
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0002_create_jobs'
+down_revision: Union[str, None] = '0001_partition_users_by_tenant'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    # Databases bootstrapped by create_all before this revision already have the table.
+    if inspector.has_table("jobs"):
+        columns = {column["name"] for column in inspector.get_columns("jobs")}
+        if "next_run_at" not in columns:
+            op.add_column("jobs", sa.Column("next_run_at", sa.DateTime(), nullable=True))
+        return
+
+    op.create_table(
+        "jobs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("tenant_id", sa.String(length=50), nullable=False),
+        sa.Column("kind", sa.String(length=50), nullable=False),
+        sa.Column("params", sa.JSON(), nullable=False),
+        sa.Column("status", sa.String(length=20), server_default="pending", nullable=False),
+        sa.Column("checkpoint", sa.Integer(), nullable=True),
+        sa.Column("processed", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("total", sa.Integer(), nullable=True),
+        sa.Column("attempts", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column("cancel_requested", sa.Boolean(), server_default=sa.text("false"), nullable=False),
+        sa.Column("result", sa.JSON(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_by", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("heartbeat_at", sa.DateTime(), nullable=True),
+        sa.Column("next_run_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index(op.f("ix_jobs_status"), "jobs", ["status"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_jobs_status"), table_name="jobs")
+    op.drop_table("jobs")